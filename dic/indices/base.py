@@ -1,13 +1,130 @@
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
+from functools import cached_property
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Lower bounds of each drought class above 'Extreme Drought'
+_THRESH = np.array([-1.99, -1.49, -0.99, -0.49, 0.50, 1.00, 1.50, 2.00])
+_LABELS = np.array([
+    'Extreme Drought', 'Severe Drought', 'Moderate Drought', 'Mild Drought', 'Normal',
+    'Mild Wet', 'Moderate Wet', 'Severe Wet', 'Extremely Wet'
+], dtype=object)
+_CLASS_DTYPE = pd.CategoricalDtype([*_LABELS, 'No Data'], ordered=True)
+
+# Season code per calendar month (Jan-Dec) and season names by code
+_SEASON_CODES = np.array([0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0], dtype=np.int8)
+_SEASON_NAMES = np.array(['Winter', 'Spring', 'Summer', 'Fall'], dtype=object)
+
+
+def _monthly_index(year, month):
+    """DatetimeIndex of month starts built from integer year and month columns"""
+    year = np.asarray(year, dtype=np.int64)
+    month = np.asarray(month, dtype=np.int64)
+    if ((month < 1) | (month > 12)).any():
+        raise ValueError("Month values must be between 1 and 12")
+    
+    # Months since the epoch map directly onto datetime64[M]
+    months = (year - 1970) * 12 + (month - 1)
+    return pd.DatetimeIndex(months.astype('datetime64[M]').astype('datetime64[ns]'), name='date')
+
+
+def _wh_transform(x, center, std, skew):
+    """Wilson-Hilferty cube root transformation of x (NaNs pass through)"""
+    z = (x - center) / std
+    inv6s = 6 / skew
+    return np.where(np.isnan(x), np.nan, inv6s * np.cbrt((skew / 2) * z + 1) - (inv6s + skew / 6))
+
+
+def _power_sums_numpy(x, shift):
+    """
+    Count and sums of d, d**2 and d**3 with d = x - shift over the non-NaN
+    values of x; a NaN shift uses the first non-NaN value
+    """
+    p = x[~np.isnan(x)]
+    if np.isnan(shift) and p.size:
+        shift = p[0]
+    d = p - shift
+    d2 = d * d
+    return p.size, shift, d.sum(), d2.sum(), d2 @ d
+
+
+if njit is not None:
+    # fastmath without 'nnan' so the NaN checks below are not optimised away
+    @njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _power_sums(x, shift):
+        """
+        Count and sums of d, d**2 and d**3 with d = x - shift over the non-NaN
+        values of x; a NaN shift uses the first non-NaN value
+        """
+        n = 0
+        s1 = 0.0
+        s2 = 0.0
+        s3 = 0.0
+        for i in range(x.size):
+            if not np.isnan(x[i]):
+                if n == 0 and np.isnan(shift):
+                    shift = x[i]
+                d = x[i] - shift
+                d2 = d * d
+                n += 1
+                s1 += d
+                s2 += d2
+                s3 += d2 * d
+        return n, shift, s1, s2, s3
+else:
+    _power_sums = _power_sums_numpy
+
+
+def _moments(x, center=None):
+    """
+    Single-pass sample statistics of the non-NaN values of x
+    
+    The power sums are taken about a shift close to the data (center, or the
+    first non-NaN value) so that a large mean does not cancel the spread.
+    
+    Parameters:
+    x: float64 numpy array
+    center: point for the third moment (defaults to the mean)
+    
+    Returns:
+    n, mean, standard deviation (ddof=1), third moment about center
+    """
+    n, shift, s1, s2, s3 = _power_sums(x, np.nan if center is None else float(center))
+    if n < 2:
+        return n, np.nan, np.nan, np.nan
+    
+    mean_d = s1 / n
+    e = mean_d if center is None else center - shift
+    
+    # Last-resort guard: results within rounding noise of the sums are zero
+    tol = 64 * np.finfo(np.float64).eps
+    ss = s2 - s1 * mean_d
+    var = ss / (n - 1) if ss > tol * s2 else 0.0
+    m3 = (s3 - 3 * e * s2 + 3 * e * e * s1 - n * e ** 3) / n
+    if abs(m3) <= tol * (abs(s3) + 3 * abs(e) * s2 + 3 * e * e * abs(s1) + n * abs(e) ** 3) / n:
+        m3 = 0.0
+    
+    return n, shift + mean_d, np.sqrt(var), m3
+
 
 class BaseDroughtIndex(ABC):
     """Base class for all drought indices"""
     
-    def __init__(self, data):
-        self.data = data.copy()
+    def __init__(self, data, copy=True):
+        """
+        Parameters:
+        data: DataFrame with 'year', 'month', 'precipitation' columns
+        copy: copy the input data; with False the column arrays are shared
+              with the input, which is never modified
+        """
+        self.data = data.copy() if copy else data
         self._validate_data()
+        self._preprocess_data()
     
     def _validate_data(self):
         """Validate input data structure"""
@@ -15,6 +132,60 @@ class BaseDroughtIndex(ABC):
         if not all(col in self.data.columns for col in required_columns):
             raise ValueError(f"Data must contain columns: {required_columns}")
     
+    def _preprocess_data(self):
+        """Index the data by month start date and cache the precipitation array"""
+        index = _monthly_index(self.data['year'], self.data['month'])
+        
+        # Data already indexed by its own year/month (e.g. another calculator's data) is reused as is
+        if not index.equals(self.data.index):
+            # set_index would deep-copy every column; nothing writes to self.data,
+            # so a shallow copy with the new index shares the input's arrays
+            data = self.data.copy(deep=False)
+            data.index = index
+            self.data = data
+        
+        self._precip = self.data['precipitation'].to_numpy(dtype=np.float64)
+        self._index = self.data.index
+    
+    @cached_property
+    def _year_key(self):
+        """Calendar year of every row"""
+        return self._index.year.to_numpy().astype(np.int16)
+    
+    @cached_property
+    def _month_key(self):
+        """Calendar month (1-12) of every row"""
+        return self._index.month.to_numpy().astype(np.int8)
+    
+    @cached_property
+    def _season_key(self):
+        """
+        Integer season key (year * 10 + season code) for every row
+        
+        December belongs to the following year's winter.
+        """
+        season_year = self._year_key.astype(np.int64) + (self._month_key == 12)
+        return season_year * 10 + _SEASON_CODES[self._month_key - 1]
+    
+    @cached_property
+    def _season_groups(self):
+        """Precipitation grouped by season key, reused across calls"""
+        return self.data['precipitation'].groupby(
+            self._season_key, sort=not self._keys_sorted, observed=True
+        )
+    
+    @cached_property
+    def _annual_groups(self):
+        """Precipitation grouped by year, reused across calls"""
+        return self.data['precipitation'].groupby(
+            self._year_key, sort=not self._keys_sorted, observed=True
+        )
+    
+    @cached_property
+    def _keys_sorted(self):
+        """Chronological data already yields groups in order, so groupby can skip sorting"""
+        return self._index.is_monotonic_increasing
+    
     @abstractmethod
     def calculate(self):
         """Calculate the drought index - to be implemented by subclasses"""
@@ -25,30 +196,22 @@ class BaseDroughtIndex(ABC):
         """
         Classify drought based on index value
         
+        Class boundaries (lower bound inclusive): Extremely Wet >= 2.0,
+        Severe Wet >= 1.50, Moderate Wet >= 1.00, Mild Wet >= 0.50,
+        Normal >= -0.49, Mild Drought >= -0.99, Moderate Drought >= -1.49,
+        Severe Drought >= -1.99, otherwise Extreme Drought.
+        
         Parameters:
-        index_value: drought index value
+        index_value: drought index value, or array-like of values
         
         Returns:
-        drought_class: string classification
+        drought_class: string classification (ordered pandas Categorical for
+        array input)
         """
-        if pd.isna(index_value):
-            return 'No Data'
+        values = np.asarray(index_value, dtype=np.float64)
+        if values.ndim == 0:
+            return 'No Data' if np.isnan(values) else _LABELS[np.searchsorted(_THRESH, values, side='right')]
         
-        if index_value >= 2.0:
-            return 'Extremely Wet'
-        elif index_value >= 1.50:
-            return 'Severe Wet'
-        elif index_value >= 1.00:
-            return 'Moderate Wet'
-        elif index_value >= 0.50:
-            return 'Mild Wet'
-        elif index_value >= -0.49:
-            return 'Normal'
-        elif index_value >= -0.99:
-            return 'Mild Drought'
-        elif index_value >= -1.49:
-            return 'Moderate Drought'
-        elif index_value >= -1.99:
-            return 'Severe Drought'
-        else:
-            return 'Extreme Drought'
+        codes = np.searchsorted(_THRESH, values, side='right').astype(np.int8)
+        codes[np.isnan(values)] = len(_LABELS)
+        return pd.Categorical.from_codes(codes, dtype=_CLASS_DTYPE)
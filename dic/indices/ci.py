@@ -3,6 +3,31 @@ import numpy as np
 from scipy import stats
 from .base import BaseDroughtIndex
 
+# Lower bounds of each CI class above 'Extreme Drought' (Table 3.1). 'Normal'
+# starts strictly above -0.6, hence the next representable float.
+_CI_THRESH = np.array([-2.4, -1.8, -1.2, np.nextafter(-0.6, 0)])
+_CI_LABELS = np.array([
+    'Extreme Drought', 'Severe Drought', 'Moderate Drought', 'Mild Drought', 'Normal'
+], dtype=object)
+_CI_CLASS_DTYPE = pd.CategoricalDtype([*_CI_LABELS, 'No Data'], ordered=True)
+
+
+def _norm_ppf(F):
+    """
+    Standard normal quantile function for SPI
+    
+    Rational approximation of Abramowitz and Stegun (1965) eq. 26.2.23 as
+    used by Edwards and McKee (1997); absolute error < 4.5e-4.
+    """
+    F = np.asarray(F, dtype=np.float64)
+    upper = F > 0.5
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.sqrt(-2 * np.log(np.where(upper, 1 - F, F)))
+        num = (0.010328 * t + 0.802853) * t + 2.515517
+        den = ((0.001308 * t + 0.189269) * t + 1.432788) * t + 1.0
+        z = np.where(np.isinf(t), t, t - num / den)
+    return np.where(upper, z, -z)
+
 class CompositeIndex(BaseDroughtIndex):
     """
     Composite Index (CI) calculator 
@@ -13,25 +38,100 @@ class CompositeIndex(BaseDroughtIndex):
     - Zhang et al. (2006)
     """
     
-    def __init__(self, data, temperature_data=None):
+    def __init__(self, data, temperature_data=None, copy=True):
         """
         Initialize Composite Index calculator
         
         Args:
             data: DataFrame with 'year', 'month', 'precipitation' columns
             temperature_data: DataFrame with temperature data (optional)
+            copy: copy the input data (False shares its memory; the input is never modified)
         """
-        super().__init__(data)
+        super().__init__(data, copy=copy)
         self.temperature_data = temperature_data
         self.coefficients = {'a': 0.47, 'b': 0.36, 'c': 0.96}
-        self._preprocess_data()
     
-    def _preprocess_data(self):
-        """Preprocess the input data"""
-        self.data['date'] = pd.to_datetime(
-            self.data[['year', 'month']].assign(day=1)
+    def _rolling_sums(self, timescales, precip=None):
+        """
+        Rolling precipitation sums of the input series for several timescales
+        
+        Args:
+            timescales: sequence of time scales in months
+            precip: precipitation array, defaults to the input series
+            
+        Returns:
+            2-D array with one column of rolling sums per timescale
+        """
+        if precip is None:
+            precip = self._precip
+        missing = np.isnan(precip)
+        
+        # Prefix sums shared by all timescales; windows with gaps stay NaN
+        cs = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, precip))))
+        cn = np.concatenate(([0], np.cumsum(missing)))
+        
+        rolling_sums = np.full((len(precip), len(timescales)), np.nan)
+        for j, timescale in enumerate(timescales):
+            if len(precip) >= timescale:
+                rolling_sums[timescale - 1:, j] = np.where(
+                    cn[timescale:] > cn[:-timescale], np.nan, cs[timescale:] - cs[:-timescale]
+                )
+        return rolling_sums
+    
+    def _spi_from_rolling_sums(self, rolling_sums, month):
+        """
+        Fit the gamma distribution and transform rolling sums to SPI
+        
+        One distribution is fitted per calendar month over the whole record,
+        for all columns at once.
+        
+        Args:
+            rolling_sums: 2-D array with one column of rolling sums per timescale
+            month: calendar month (1-12) of each row
+            
+        Returns:
+            spi_values: 2-D array of SPI values, same shape as rolling_sums
+        """
+        x = rolling_sums
+        month_idx = np.asarray(month) - 1
+        
+        # Split each value into zero/non-zero parts for the mixed distribution
+        valid = ~np.isnan(x)
+        positive = x > 0
+        log_x = np.log(x, out=np.zeros_like(x), where=positive)
+        
+        # Calibration statistics with one bin per (calendar month, timescale)
+        n_cols = x.shape[1]
+        bins = (month_idx[:, np.newaxis] + 12 * np.arange(n_cols)).ravel()
+        
+        def monthly_sum(values):
+            return np.bincount(bins, weights=values.ravel(), minlength=12 * n_cols).reshape(n_cols, 12).T
+        
+        n = monthly_sum(valid)
+        n_pos = monthly_sum(positive)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Thom (1958) maximum likelihood approximation of the gamma parameters
+            mean = monthly_sum(np.where(positive, x, 0.0)) / n_pos
+            A = np.log(mean) - monthly_sum(log_x) / n_pos
+            alpha = (1 + np.sqrt(1 + 4 * A / 3)) / (4 * A)
+            beta = mean / alpha
+            
+            # Probability of zero precipitation
+            q = (n - n_pos) / n
+        
+        fit_ok = (n > 1) & (n_pos > 1) & (A > 0)
+        prob = np.full_like(x, np.nan)
+        
+        # Gather the calendar-month fits back onto each row
+        fitted = fit_ok[month_idx] & valid
+        alpha, beta, q = alpha[month_idx], beta[month_idx], q[month_idx]
+        prob[fitted] = q[fitted] + (1 - q[fitted]) * stats.gamma.cdf(
+            x[fitted], alpha[fitted], scale=beta[fitted]
         )
-        self.data = self.data.set_index('date')
+        
+        # Convert to SPI (standard normal)
+        return _norm_ppf(prob)
     
     def calculate_spi(self, timescale, precipitation_series):
         """
@@ -39,7 +139,8 @@ class CompositeIndex(BaseDroughtIndex):
         
         Args:
             timescale: time scale in months (1, 3, 6, 12, etc.)
-            precipitation_series: pandas Series of precipitation values
+            precipitation_series: pandas Series of precipitation values, either
+                with a DatetimeIndex or row-aligned with the calculator's data
             
         Returns:
             spi_values: pandas Series of SPI values
@@ -50,43 +151,47 @@ class CompositeIndex(BaseDroughtIndex):
             return pd.Series([np.nan] * len(precipitation_series), 
                            index=precipitation_series.index)
         
+        # SPI is fitted per calendar month, taken from the dates or the input rows
+        if isinstance(precipitation_series.index, pd.DatetimeIndex):
+            month = precipitation_series.index.month
+        elif len(precipitation_series) == len(self._month_key):
+            month = self._month_key
+        else:
+            raise ValueError(
+                "precipitation_series needs a DatetimeIndex or one value per row of the input data"
+            )
+        
         # Calculate rolling sum
-        rolling_sum = precip.rolling(window=timescale, min_periods=timescale).sum()
-        
-        spi_values = []
-        for i in range(len(rolling_sum)):
-            if i < timescale - 1:
-                spi_values.append(np.nan)
-            else:
-                # Use available data for distribution fitting
-                sample_data = rolling_sum.iloc[max(0, i-359):i+1].dropna()
-                
-                if len(sample_data) > 1:
-                    # Fit gamma distribution
-                    params = stats.gamma.fit(sample_data, floc=0)
-                    # Calculate cumulative probability
-                    prob = stats.gamma.cdf(rolling_sum.iloc[i], *params)
-                    # Convert to SPI (standard normal)
-                    spi = stats.norm.ppf(prob)
-                    spi_values.append(spi)
-                else:
-                    spi_values.append(np.nan)
-        
-        return pd.Series(spi_values, index=precipitation_series.index)
+        rolling_sums = self._rolling_sums((timescale,), precipitation_series.to_numpy(dtype=np.float64))
+        spi_values = self._spi_from_rolling_sums(rolling_sums, month)
+        
+        return pd.Series(spi_values[:, 0], index=precipitation_series.index)
     
     def calculate_potential_evapotranspiration(self):
         """
         Calculate Potential Evapotranspiration using simplified method
+        
+        Returns:
+            pet: numpy array of PET values
         """
         # Simplified PET calculation - you can enhance this with proper temperature data
         if self.temperature_data is not None:
             # If temperature data available, use Hargreaves method
-            self.data['PET'] = 0.0023 * 0.408 * self.temperature_data['temperature'] * 50
+            temperature = self.temperature_data['temperature'].to_numpy(dtype=np.float64)
+            return 0.0023 * 0.408 * temperature * 50
         else:
             # Simplified approach based on precipitation
-            self.data['PET'] = self.data['precipitation'] * 0.7
+            return self._precip * 0.7
+    
+    def _moisture_index(self):
+        """Moisture index M₃₀ as a numpy array"""
+        pet = self.calculate_potential_evapotranspiration()
         
-        return self.data['PET']
+        # Avoid division by zero (default value 0 when precipitation is 0)
+        return np.divide(
+            self._precip - pet, self._precip,
+            out=np.zeros_like(self._precip), where=self._precip > 0
+        )
     
     def calculate_moisture_index(self):
         """
@@ -95,17 +200,7 @@ class CompositeIndex(BaseDroughtIndex):
         Returns:
             moisture_index: pandas Series of moisture index values
         """
-        pet = self.calculate_potential_evapotranspiration()
-        precipitation = self.data['precipitation']
-        
-        # Avoid division by zero
-        moisture_index = np.where(
-            precipitation > 0,
-            (precipitation - pet) / precipitation,
-            0  # Default value when precipitation is 0
-        )
-        
-        return pd.Series(moisture_index, index=self.data.index)
+        return pd.Series(self._moisture_index(), index=self._index)
     
     def calculate_composite_index(self):
         """
@@ -115,26 +210,28 @@ class CompositeIndex(BaseDroughtIndex):
             DataFrame with CI results
         """
         # Calculate required components
-        spi_1month = self.calculate_spi(1, self.data['precipitation'])  # Z₃₀
-        spi_3month = self.calculate_spi(3, self.data['precipitation'])  # Z₉₀
-        moisture_index = self.calculate_moisture_index()  # M₃₀
-        
-        # Apply coefficients and calculate CI
-        ci_values = (
-            self.coefficients['a'] * np.array(spi_1month) +
-            self.coefficients['b'] * np.array(spi_3month) + 
-            self.coefficients['c'] * np.array(moisture_index)
-        )
+        spi = self._spi_from_rolling_sums(self._rolling_sums((1, 3)), self._month_key)
+        spi_1month = spi[:, 0]  # Z₃₀
+        spi_3month = spi[:, 1]  # Z₉₀
+        moisture_index = self._moisture_index()  # M₃₀
+        
+        # Apply coefficients and calculate CI, accumulating into one buffer
+        ca = self.coefficients
+        ci_values = np.multiply(spi_1month, ca['a'])
+        ci_values += ca['b'] * spi_3month
+        ci_values += ca['c'] * moisture_index
         
         # Create result DataFrame
-        result_df = self.data.reset_index()[['year', 'month', 'precipitation']].copy()
-        result_df['SPI_1month'] = spi_1month.values
-        result_df['SPI_3month'] = spi_3month.values
-        result_df['Moisture_Index'] = moisture_index.values
-        result_df['Composite_Index'] = ci_values
-        result_df['Drought_Class'] = self.classify_ci_drought(ci_values)
-        
-        return result_df
+        return pd.DataFrame({
+            'year': self.data['year'].to_numpy(),
+            'month': self.data['month'].to_numpy(),
+            'precipitation': self.data['precipitation'].to_numpy(),
+            'SPI_1month': spi_1month,
+            'SPI_3month': spi_3month,
+            'Moisture_Index': moisture_index,
+            'Composite_Index': ci_values,
+            'Drought_Class': self.classify_ci_drought(ci_values)
+        })
     
     def classify_ci_drought(self, ci_values):
         """
@@ -144,23 +241,12 @@ class CompositeIndex(BaseDroughtIndex):
             ci_values: array of CI values
             
         Returns:
-            list of drought classifications
-        """
-        categories = []
-        for ci in ci_values:
-            if np.isnan(ci):
-                categories.append('No Data')
-            elif ci > -0.6:
-                categories.append('Normal')
-            elif ci >= -1.2:
-                categories.append('Mild Drought')
-            elif ci >= -1.8:
-                categories.append('Moderate Drought')
-            elif ci >= -2.4:
-                categories.append('Severe Drought')
-            else:
-                categories.append('Extreme Drought')
-        return categories
+            ordered pandas Categorical of drought classifications
+        """
+        values = np.asarray(ci_values, dtype=np.float64)
+        codes = np.searchsorted(_CI_THRESH, values, side='right').astype(np.int8)
+        codes[np.isnan(values)] = len(_CI_LABELS)
+        return pd.Categorical.from_codes(codes, dtype=_CI_CLASS_DTYPE)
     
     def calculate(self, frequency='monthly'):
         """
@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from .base import BaseDroughtIndex
+from .base import BaseDroughtIndex, _SEASON_NAMES, _moments, _wh_transform
 
 class ModifiedChinaZIndex(BaseDroughtIndex):
     """
@@ -9,22 +9,15 @@ class ModifiedChinaZIndex(BaseDroughtIndex):
     Uses median instead of mean for better performance with skewed data
     """
     
-    def __init__(self, data):
+    def __init__(self, data, copy=True):
         """
         Initialize Modified CZI calculator
         
         Args:
             data: DataFrame with 'year', 'month', 'precipitation' columns
+            copy: copy the input data (False shares its memory; the input is never modified)
         """
-        super().__init__(data)
-        self._preprocess_data()
-    
-    def _preprocess_data(self):
-        """Preprocess the input data"""
-        self.data['date'] = pd.to_datetime(
-            self.data[['year', 'month']].assign(day=1)
-        )
-        self.data = self.data.set_index('date')
+        super().__init__(data, copy=copy)
     
     def calculate_mczi(self, precipitation_series):
         """
@@ -36,44 +29,31 @@ class ModifiedChinaZIndex(BaseDroughtIndex):
         Returns:
             mczi_values: pandas Series of MCZI values
         """
-        precip = precipitation_series.dropna()
+        x = precipitation_series.to_numpy(dtype=np.float64)
+        precip = x[~np.isnan(x)]
         
         if len(precip) < 2:
             return pd.Series([np.nan] * len(precipitation_series), 
                            index=precipitation_series.index)
         
-        # Use median instead of mean (key modification from CZI)
-        median_precip = np.median(precip)
-        std_precip = np.std(precip, ddof=1)
+        # Use median instead of mean (key modification from CZI); precip is
+        # already a NaN-free copy, so partition it in place
+        median_precip = np.median(precip, overwrite_input=True)
+        _, _, std_precip, m3 = _moments(precip, center=median_precip)
         
         if std_precip == 0:
             return pd.Series([0] * len(precipitation_series), 
                            index=precipitation_series.index)
         
-        n = len(precip)
-        
         # Calculate skewness using median
-        skewness = (np.sum((precip - median_precip) ** 3) / n) / (std_precip ** 3)
+        skewness = m3 / (std_precip ** 3)
         
-        mczi_values = []
+        if skewness == 0:
+            # Z-scores using median
+            return pd.Series((x - median_precip) / std_precip, index=precipitation_series.index)
         
-        for x in precipitation_series:
-            if pd.isna(x):
-                mczi_values.append(np.nan)
-                continue
-            
-            # Calculate Z-score using median
-            z = (x - median_precip) / std_precip
-            
-            if skewness == 0:
-                mcz = z
-            else:
-                # Apply Wilson-Hilferty transformation with median-based calculation
-                term1 = (6 / skewness) * ((skewness / 2) * z + 1) ** (1/3)
-                term2 = (6 / skewness) + (skewness / 6)
-                mcz = term1 - term2
-            
-            mczi_values.append(mcz)
+        # Apply Wilson-Hilferty transformation with median-based calculation
+        mczi_values = _wh_transform(x, median_precip, std_precip, skewness)
         
         return pd.Series(mczi_values, index=precipitation_series.index)
     
@@ -88,52 +68,35 @@ class ModifiedChinaZIndex(BaseDroughtIndex):
             'MCZI': monthly_mczi
         })
         
-        result['Drought_Class'] = result['MCZI'].apply(self.classify_drought)
+        result['Drought_Class'] = self.classify_drought(result['MCZI'].to_numpy())
         return result
     
     def calculate_seasonal_mczi(self):
         """Calculate seasonal MCZI values"""
-        seasons = {
-            1: 'Winter', 2: 'Winter', 3: 'Spring', 4: 'Spring', 5: 'Spring',
-            6: 'Summer', 7: 'Summer', 8: 'Summer', 9: 'Fall', 10: 'Fall', 
-            11: 'Fall', 12: 'Winter'
-        }
-        
-        self.data['season'] = self.data.index.month.map(seasons)
-        self.data['year_season'] = self.data.index.year.astype(str) + '_' + self.data['season']
-        
-        # Adjust for winter season (Dec belongs to next year's winter)
-        winter_mask = self.data.index.month == 12
-        self.data.loc[winter_mask, 'year_season'] = (self.data.index[winter_mask].year + 1).astype(str) + '_Winter'
-        
-        seasonal_precip = self.data.groupby('year_season')['precipitation'].sum()
+        seasonal_precip = self._season_groups.sum()
         seasonal_mczi = self.calculate_mczi(seasonal_precip)
         
-        result_data = []
-        for idx, mcz_value in seasonal_mczi.items():
-            year, season = idx.split('_')
-            result_year = int(year) if season != 'Winter' else int(year) - 1
-            
-            result_data.append({
-                'year': result_year,
-                'season': season,
-                'precipitation': seasonal_precip[idx],
-                'MCZI': mcz_value,
-                'Drought_Class': self.classify_drought(mcz_value)
-            })
-        
-        return pd.DataFrame(result_data)
+        year, code = np.divmod(seasonal_mczi.index.to_numpy(), 10)
+        
+        return pd.DataFrame({
+            'year': np.where(code == 0, year - 1, year),
+            'season': _SEASON_NAMES[code],
+            'precipitation': seasonal_precip.to_numpy(),
+            'MCZI': seasonal_mczi.to_numpy(),
+            'Drought_Class': self.classify_drought(seasonal_mczi.to_numpy())
+        })
     
     def calculate_annual_mczi(self):
         """Calculate annual MCZI values"""
-        annual_data = self.data.groupby(self.data.index.year)['precipitation'].sum().reset_index()
-        annual_data.columns = ['year', 'precipitation']
-        
-        annual_mczi = self.calculate_mczi(annual_data['precipitation'])
-        annual_data['MCZI'] = annual_mczi.values
-        annual_data['Drought_Class'] = annual_data['MCZI'].apply(self.classify_drought)
-        
-        return annual_data
+        annual_precip = self._annual_groups.sum()
+        annual_mczi = self.calculate_mczi(annual_precip)
+        
+        return pd.DataFrame({
+            'year': annual_precip.index.to_numpy().astype(np.int64),
+            'precipitation': annual_precip.to_numpy(),
+            'MCZI': annual_mczi.to_numpy(),
+            'Drought_Class': self.classify_drought(annual_mczi.to_numpy())
+        })
     
     def compare_with_czi(self, czi_calculator):
         """
@@ -145,16 +108,21 @@ class ModifiedChinaZIndex(BaseDroughtIndex):
         Returns:
             DataFrame with comparison results
         """
-        mczi_monthly = self.calculate_monthly_mczi()
-        czi_monthly = czi_calculator.calculate_monthly_czi()
+        mczi_monthly = self.calculate_monthly_mczi().set_index(['year', 'month'])
+        czi_monthly = czi_calculator.calculate_monthly_czi().set_index(['year', 'month'])
         
-        comparison_df = mczi_monthly[['year', 'month', 'precipitation', 'MCZI', 'Drought_Class']].copy()
-        comparison_df['CZI'] = czi_monthly['CZI']
-        comparison_df['CZI_Drought_Class'] = czi_monthly['Drought_Class']
-        comparison_df['Difference'] = comparison_df['MCZI'] - comparison_df['CZI']
-        comparison_df['Class_Agreement'] = comparison_df['Drought_Class'] == comparison_df['CZI_Drought_Class']
+        comparison_df = mczi_monthly[['precipitation', 'MCZI', 'Drought_Class']].join(
+            czi_monthly[['CZI', 'Drought_Class']].rename(columns={'Drought_Class': 'CZI_Drought_Class'}),
+            how='inner'
+        )
+        comparison_df['Difference'] = comparison_df['MCZI'].to_numpy() - comparison_df['CZI'].to_numpy()
+        # Both class columns share one categorical dtype, so comparing codes is enough
+        comparison_df['Class_Agreement'] = (
+            comparison_df['Drought_Class'].cat.codes.to_numpy() ==
+            comparison_df['CZI_Drought_Class'].cat.codes.to_numpy()
+        )
         
-        return comparison_df
+        return comparison_df.reset_index()
     
     def calculate(self, frequency='monthly'):
         """
@@ -1,4 +1,8 @@
 import pandas as pd
+import numpy as np
+
+# Rows converted to Python objects at a time when streaming a sheet
+_EXCEL_BLOCK_ROWS = 10_000
 
 def load_sample_data():
     """Load sample precipitation data"""
@@ -8,10 +12,41 @@ def export_to_excel(results_dict, filename='drought_indices_results.xlsx'):
     """
     Export multiple results to Excel file with different sheets
     
+    Rows are streamed to disk in fixed-size blocks with xlsxwriter in
+    constant_memory mode when it is installed; otherwise the workbook is
+    built with openpyxl.
+    
     Parameters:
     results_dict: dictionary of {sheet_name: DataFrame}
     filename: output filename
     """
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+    try:
+        import xlsxwriter
+    except ImportError:
+        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            for sheet_name, df in results_dict.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+    
+    # constant_memory flushes each row once the next one starts, so cells must
+    # be written row by row (DataFrame.to_excel writes column by column)
+    options = {
+        'constant_memory': True,
+        'nan_inf_to_errors': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+    }
+    with xlsxwriter.Workbook(filename, options) as workbook:
+        # Same header style and missing/infinite value representation as to_excel
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
         for sheet_name, df in results_dict.items():
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+            # Convert a bounded block of rows at a time so memory stays flat
+            for start in range(0, len(df), _EXCEL_BLOCK_ROWS):
+                block = df.iloc[start:start + _EXCEL_BLOCK_ROWS]
+                values = block.to_numpy(dtype=object)
+                values[block.isna().to_numpy()] = None
+                values[values == np.inf] = 'inf'
+                values[values == -np.inf] = '-inf'
+                for row, record in enumerate(values, start=start + 1):
+                    worksheet.write_row(row, 0, record)
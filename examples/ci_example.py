@@ -5,6 +5,7 @@ Example usage of Composite Index calculation
 import pandas as pd
 import numpy as np
 from dic.indices.ci import CompositeIndex
+from dic.utils import export_to_excel
 
 def main():
     # Load your data (replace with your actual data path)
@@ -14,11 +15,12 @@ def main():
     except FileNotFoundError:
         print("Sample data not found. Using generated sample data.")
         # Generate sample data for demonstration
-        dates = pd.date_range('1987-01-01', '2017-12-31', freq='M')
+        years = np.repeat(np.arange(1987, 2018), 12)
+        months = np.tile(np.arange(1, 13), 2018 - 1987)
         data = pd.DataFrame({
-            'year': dates.year,
-            'month': dates.month,
-            'precipitation': np.random.gamma(2, 2, len(dates))
+            'year': years,
+            'month': months,
+            'precipitation': np.random.gamma(2, 2, len(years))
         })
 
     # Initialize Composite Index calculator
@@ -34,6 +36,7 @@ def main():
     
     # Display drought statistics
     drought_stats = results['Drought_Class'].value_counts()
+    drought_stats = drought_stats[drought_stats > 0]
     print("\nDrought Classification Statistics:")
     for category, count in drought_stats.items():
         percentage = (count / len(results)) * 100
@@ -45,30 +48,30 @@ def main():
     
     if len(severe_droughts) > 0:
         print("Severe drought periods:")
-        for _, row in severe_droughts.head(10).iterrows():
-            print(f"  {int(row['year'])}-{int(row['month']):02d}: CI={row['Composite_Index']:.2f} ({row['Drought_Class']})")
+        columns = ['year', 'month', 'Composite_Index', 'Drought_Class']
+        for year, month, ci, drought_class in severe_droughts[columns].head(10).itertuples(index=False, name=None):
+            print(f"  {int(year)}-{int(month):02d}: CI={ci:.2f} ({drought_class})")
     
     # Save results
     results.to_csv('composite_index_results.csv', index=False)
     print(f"\nResults saved to 'composite_index_results.csv'")
     
     # Save detailed results to Excel
-    with pd.ExcelWriter('composite_index_detailed.xlsx') as writer:
-        results.to_excel(writer, sheet_name='Composite_Index', index=False)
-        
-        # Add summary statistics
-        summary = pd.DataFrame({
-            'Statistic': ['Mean CI', 'Min CI', 'Max CI', 'Std CI', 
-                         'Normal Months', 'Drought Months', 'Severe+ Drought Months'],
-            'Value': [results['Composite_Index'].mean(), 
-                     results['Composite_Index'].min(),
-                     results['Composite_Index'].max(),
-                     results['Composite_Index'].std(),
-                     len(results[results['Drought_Class'] == 'Normal']),
-                     len(results[results['Drought_Class'].str.contains('Drought')]),
-                     len(severe_droughts)]
-        })
-        summary.to_excel(writer, sheet_name='Summary', index=False)
+    # Add summary statistics (reusing the class counts from above)
+    ci_stats = results['Composite_Index'].agg(['mean', 'min', 'max', 'std'])
+    drought_months = drought_stats[drought_stats.index.str.contains('Drought')].sum()
+    summary = pd.DataFrame({
+        'Statistic': ['Mean CI', 'Min CI', 'Max CI', 'Std CI', 
+                     'Normal Months', 'Drought Months', 'Severe+ Drought Months'],
+        'Value': [*ci_stats,
+                 drought_stats.get('Normal', 0),
+                 drought_months,
+                 len(severe_droughts)]
+    })
+    export_to_excel({
+        'Composite_Index': results,
+        'Summary': summary
+    }, 'composite_index_detailed.xlsx')
     
     print("Detailed results saved to 'composite_index_detailed.xlsx'")
 
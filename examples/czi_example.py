@@ -4,6 +4,7 @@ Example usage of China Z-Index calculation
 
 import pandas as pd
 from dic.indices.czi import ChinaZIndex
+from dic.utils import export_to_excel
 
 def main():
     # Load your data (replace with your actual data path)
@@ -13,11 +14,12 @@ def main():
         print("Sample data not found. Using generated sample data.")
         # Generate sample data for demonstration
         import numpy as np
-        dates = pd.date_range('1987-01-01', '2017-12-31', freq='M')
+        years = np.repeat(np.arange(1987, 2018), 12)
+        months = np.tile(np.arange(1, 13), 2018 - 1987)
         data = pd.DataFrame({
-            'year': dates.year,
-            'month': dates.month,
-            'precipitation': np.random.gamma(2, 2, len(dates))
+            'year': years,
+            'month': months,
+            'precipitation': np.random.gamma(2, 2, len(years))
         })
     
     # Initialize CZI calculator
@@ -29,10 +31,11 @@ def main():
     annual_results = calculator.calculate_annual_czi()
     
     # Save results
-    with pd.ExcelWriter('czi_results.xlsx') as writer:
-        monthly_results.to_excel(writer, sheet_name='Monthly', index=False)
-        seasonal_results.to_excel(writer, sheet_name='Seasonal', index=False)
-        annual_results.to_excel(writer, sheet_name='Annual', index=False)
+    export_to_excel({
+        'Monthly': monthly_results,
+        'Seasonal': seasonal_results,
+        'Annual': annual_results
+    }, 'czi_results.xlsx')
     
     print("CZI calculation completed!")
     print(f"Monthly results: {len(monthly_results)} records")
@@ -5,8 +5,10 @@ and comparison with standard CZI
 
 import pandas as pd
 import numpy as np
+from scipy.stats import describe
 from dic.indices.mczi import ModifiedChinaZIndex
 from dic.indices.czi import ChinaZIndex
+from dic.utils import export_to_excel
 
 def main():
     # Load your data (replace with your actual data path)
@@ -16,13 +18,17 @@ def main():
     except FileNotFoundError:
         print("Sample data not found. Using generated sample data.")
         # Generate sample data for demonstration
-        dates = pd.date_range('1987-01-01', '2017-12-31', freq='M')
+        years = np.repeat(np.arange(1987, 2018), 12)
+        months = np.tile(np.arange(1, 13), 2018 - 1987)
         np.random.seed(42)  # For reproducible results
         data = pd.DataFrame({
-            'year': dates.year,
-            'month': dates.month,
-            'precipitation': np.random.gamma(2, 2, len(dates))
+            'year': years,
+            'month': months,
+            'precipitation': np.random.gamma(2, 2, len(years))
         })
+    
+    # Compact integer year/month columns for faster grouping
+    data[['year', 'month']] = data[['year', 'month']].astype('int16')
 
     # Initialize both MCZI and CZI calculators
     mczi_calculator = ModifiedChinaZIndex(data)
@@ -44,15 +50,17 @@ def main():
     
     # Display drought statistics for MCZI
     mczi_drought_stats = monthly_results['Drought_Class'].value_counts()
+    mczi_drought_stats = mczi_drought_stats[mczi_drought_stats > 0]
+    mczi_drought_pct = mczi_drought_stats / mczi_drought_stats.sum() * 100
     print("\nMCZI Drought Classification Statistics:")
-    for category, count in mczi_drought_stats.items():
-        percentage = (count / len(monthly_results)) * 100
-        print(f"  {category}: {count} months ({percentage:.1f}%)")
+    print(pd.concat([mczi_drought_stats, mczi_drought_pct.round(1)], axis=1,
+                    keys=['months', 'percent']).to_string())
     
     # Comparison statistics
-    agreement_rate = comparison_results['Class_Agreement'].mean() * 100
-    mean_difference = comparison_results['Difference'].mean()
-    abs_mean_difference = comparison_results['Difference'].abs().mean()
+    difference = comparison_results['Difference'].to_numpy()
+    agreement_rate = comparison_results['Class_Agreement'].to_numpy().mean() * 100
+    mean_difference = np.nanmean(difference)
+    abs_mean_difference = np.nanmean(np.abs(difference))
     
     print(f"\n=== MCZI vs CZI Comparison ===")
     print(f"Classification agreement: {agreement_rate:.1f}%")
@@ -71,38 +79,49 @@ def main():
                   f"CZI={row['CZI']:.2f} ({row['CZI_Drought_Class']})")
     
     # Save results
-    with pd.ExcelWriter('mczi_analysis_results.xlsx') as writer:
-        monthly_results.to_excel(writer, sheet_name='MCZI_Monthly', index=False)
-        seasonal_results.to_excel(writer, sheet_name='MCZI_Seasonal', index=False)
-        annual_results.to_excel(writer, sheet_name='MCZI_Annual', index=False)
-        comparison_results.to_excel(writer, sheet_name='MCZI_CZI_Comparison', index=False)
-        
-        # Add summary statistics
-        summary_data = {
-            'Statistic': [
-                'Total Months', 'MCZI-CZI Agreement Rate', 
-                'Mean Difference', 'Absolute Mean Difference',
-                'MCZI Mean', 'CZI Mean', 'MCZI Std', 'CZI Std'
-            ],
-            'Value': [
-                len(monthly_results),
-                agreement_rate,
-                mean_difference,
-                abs_mean_difference,
-                monthly_results['MCZI'].mean(),
-                comparison_results['CZI'].mean(),
-                monthly_results['MCZI'].std(),
-                comparison_results['CZI'].std()
-            ]
-        }
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+    # Add summary statistics (NaN-skipping, sample std as in pandas)
+    mczi_values = monthly_results['MCZI'].to_numpy()
+    czi_values = comparison_results['CZI'].to_numpy()
+    summary_data = {
+        'Statistic': [
+            'Total Months', 'MCZI-CZI Agreement Rate', 
+            'Mean Difference', 'Absolute Mean Difference',
+            'MCZI Mean', 'CZI Mean', 'MCZI Std', 'CZI Std'
+        ],
+        'Value': [
+            len(monthly_results),
+            agreement_rate,
+            mean_difference,
+            abs_mean_difference,
+            np.nanmean(mczi_values),
+            np.nanmean(czi_values),
+            np.nanstd(mczi_values, ddof=1),
+            np.nanstd(czi_values, ddof=1)
+        ]
+    }
+    summary_df = pd.DataFrame(summary_data)
+    
+    # Write each column once: precipitation lives in the monthly sheet and the
+    # comparison sheet keeps only CZI and the deltas next to the keys
+    monthly_slim = monthly_results.astype({'year': np.int16, 'month': np.int8})
+    comparison_slim = comparison_results[
+        ['year', 'month', 'CZI', 'CZI_Drought_Class', 'Difference', 'Class_Agreement']
+    ].astype({'year': np.int16, 'month': np.int8})
+    
+    # Stream sheets to disk (xlsxwriter constant_memory mode when installed)
+    export_to_excel({
+        'MCZI_Monthly': monthly_slim,
+        'MCZI_Seasonal': seasonal_results,
+        'MCZI_Annual': annual_results,
+        'MCZI_CZI_Comparison': comparison_slim,
+        'Summary': summary_df
+    }, 'mczi_analysis_results.xlsx')
     
     print(f"\nResults saved to 'mczi_analysis_results.xlsx'")
     
     # Save individual CSV files
-    monthly_results.to_csv('mczi_monthly_results.csv', index=False)
-    comparison_results.to_csv('mczi_czi_comparison.csv', index=False)
+    monthly_slim.to_csv('mczi_monthly_results.csv', index=False)
+    comparison_slim.to_csv('mczi_czi_comparison.csv', index=False)
     print("Individual CSV files saved")
 
 def demonstrate_median_advantage():
@@ -116,13 +135,15 @@ def demonstrate_median_advantage():
     skewed_data = np.random.gamma(1, 1, 1000)  # Highly skewed data
     skewed_data = np.append(skewed_data, [50, 60, 70])  # Add extreme values
     
-    mean_val = np.mean(skewed_data)
+    # describe() gets mean and skewness from a single set of moments
+    summary = describe(skewed_data)
+    mean_val = summary.mean
     median_val = np.median(skewed_data)
     
     print(f"Skewed data statistics:")
     print(f"  Mean: {mean_val:.2f}")
     print(f"  Median: {median_val:.2f}")
-    print(f"  Skewness: {stats.skew(skewed_data):.2f}")
+    print(f"  Skewness: {summary.skewness:.2f}")
     print(f"  Difference (Mean - Median): {mean_val - median_val:.2f}")
     print("\nThe median is less affected by extreme values, making MCZI more robust.")
 
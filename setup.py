@@ -22,12 +22,15 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "numba": ["numba>=0.53"],
+        "xlsxwriter": ["XlsxWriter>=1.2"],
+    },
     include_package_data=True,
 )
@@ -1,31 +1,40 @@
+import functools
 import unittest
 import pandas as pd
 import numpy as np
-from dic.indices.ci import CompositeIndex
+from scipy import stats
+from dic.indices.ci import CompositeIndex, _norm_ppf
+
+@functools.lru_cache(maxsize=1)
+def _sample(n):
+    """Deterministic gamma-distributed precipitation sample, generated once"""
+    rng = np.random.default_rng(0)
+    return rng.gamma(2, 2, n)
 
 class TestCompositeIndex(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test data"""
-        dates = pd.date_range('2000-01-01', '2002-12-31', freq='M')
-        self.sample_data = pd.DataFrame({
-            'year': dates.year,
-            'month': dates.month,
-            'precipitation': np.random.gamma(2, 2, len(dates))
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data and a shared calculator"""
+        years = np.repeat(np.arange(2000, 2003, dtype=np.int16), 12)
+        months = np.tile(np.arange(1, 13, dtype=np.int8), 3)
+        cls.sample_data = pd.DataFrame({
+            'year': years,
+            'month': months,
+            'precipitation': _sample(len(years))
         })
+        cls.calculator = CompositeIndex(cls.sample_data)
     
     def test_initialization(self):
         """Test Composite Index calculator initialization"""
-        calculator = CompositeIndex(self.sample_data)
-        self.assertIsInstance(calculator, CompositeIndex)
-        self.assertEqual(calculator.coefficients['a'], 0.47)
-        self.assertEqual(calculator.coefficients['b'], 0.36)
-        self.assertEqual(calculator.coefficients['c'], 0.96)
+        self.assertIsInstance(self.calculator, CompositeIndex)
+        self.assertEqual(self.calculator.coefficients['a'], 0.47)
+        self.assertEqual(self.calculator.coefficients['b'], 0.36)
+        self.assertEqual(self.calculator.coefficients['c'], 0.96)
     
     def test_composite_index_calculation(self):
         """Test Composite Index calculation"""
-        calculator = CompositeIndex(self.sample_data)
-        results = calculator.calculate_composite_index()
+        results = self.calculator.calculate_composite_index()
         
         # Check required columns
         required_columns = ['year', 'month', 'precipitation', 'SPI_1month', 
@@ -38,32 +47,59 @@ class TestCompositeIndex(unittest.TestCase):
     
     def test_drought_classification(self):
         """Test CI drought classification"""
-        calculator = CompositeIndex(self.sample_data)
-        
         test_cases = [
             (-0.3, 'Normal'),
             (-0.8, 'Mild Drought'),
             (-1.5, 'Moderate Drought'),
             (-2.0, 'Severe Drought'),
-            (-2.5, 'Extreme Drought')
+            (-2.5, 'Extreme Drought'),
+            (-0.6, 'Mild Drought'),
+            (np.nan, 'No Data')
         ]
         
-        for ci_value, expected_class in test_cases:
-            classified = calculator.classify_ci_drought([ci_value])[0]
-            self.assertEqual(classified, expected_class)
+        ci_values, expected = zip(*test_cases)
+        classified = self.calculator.classify_ci_drought(ci_values)
+        self.assertEqual(list(classified), list(expected))
     
     def test_moisture_index_calculation(self):
         """Test moisture index calculation"""
-        calculator = CompositeIndex(self.sample_data)
-        moisture_index = calculator.calculate_moisture_index()
+        moisture_index = self.calculator.calculate_moisture_index()
         
         self.assertEqual(len(moisture_index), len(self.sample_data))
         self.assertTrue(all(moisture_index <= 1))  # Moisture index should be <= 1
     
+    def test_spi_fitted_per_calendar_month(self):
+        """Test that SPI removes the seasonal cycle by fitting each calendar month"""
+        rng = np.random.default_rng(0)
+        seasonal_data = pd.DataFrame({
+            'year': np.repeat(np.arange(1980, 2010), 12),
+            'month': np.tile(np.arange(1, 13), 30),
+            'precipitation': rng.gamma(2, np.tile(np.arange(1, 13), 30))  # Wetter towards December
+        })
+        
+        calculator = CompositeIndex(seasonal_data)
+        spi = calculator.calculate_spi(1, calculator.data['precipitation'])
+        monthly_mean = spi.groupby(spi.index.month, sort=False).mean()
+        
+        self.assertTrue((monthly_mean.abs() < 0.3).all())
+    
+    def test_spi_without_datetime_index(self):
+        """Test SPI for a series without dates, aligned by row or rejected"""
+        precipitation = self.calculator.data['precipitation']
+        spi = self.calculator.calculate_spi(3, precipitation.reset_index(drop=True))
+        
+        np.testing.assert_array_equal(spi.to_numpy(), self.calculator.calculate_spi(3, precipitation).to_numpy())
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_spi(3, pd.Series(_sample(len(precipitation))[:-1]))
+    
+    def test_norm_ppf_approximation(self):
+        """Test the SPI normal quantile approximation against scipy"""
+        prob = np.linspace(0.001, 0.999, 999)
+        np.testing.assert_allclose(_norm_ppf(prob), stats.norm.ppf(prob), atol=4.5e-4)
+    
     def test_main_calculate_method(self):
         """Test main calculate method"""
-        calculator = CompositeIndex(self.sample_data)
-        results = calculator.calculate('monthly')
+        results = self.calculator.calculate('monthly')
         
         self.assertIn('Composite_Index', results.columns)
         self.assertIn('Drought_Class', results.columns)
@@ -1,28 +1,67 @@
+import functools
 import unittest
 import pandas as pd
 import numpy as np
 from dic.indices.czi import ChinaZIndex
+from dic.indices.base import _moments, _power_sums, _power_sums_numpy
+
+@functools.lru_cache(maxsize=1)
+def _sample(n):
+    """Deterministic gamma-distributed precipitation sample, generated once"""
+    rng = np.random.default_rng(0)
+    return rng.gamma(2, 2, n)
 
 class TestChinaZIndex(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test data"""
-        dates = pd.date_range('2000-01-01', '2005-12-31', freq='M')
-        self.sample_data = pd.DataFrame({
-            'year': dates.year,
-            'month': dates.month,
-            'precipitation': np.random.gamma(2, 2, len(dates))
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data and a shared calculator"""
+        years = np.repeat(np.arange(2000, 2006, dtype=np.int16), 12)
+        months = np.tile(np.arange(1, 13, dtype=np.int8), 6)
+        cls.sample_data = pd.DataFrame({
+            'year': years,
+            'month': months,
+            'precipitation': _sample(len(years))
         })
+        cls.calculator = ChinaZIndex(cls.sample_data)
     
     def test_initialization(self):
         """Test CZI calculator initialization"""
-        calculator = ChinaZIndex(self.sample_data)
-        self.assertIsInstance(calculator, ChinaZIndex)
+        self.assertIsInstance(self.calculator, ChinaZIndex)
+    
+    def test_no_copy_leaves_input_unchanged(self):
+        """Test that copy=False never modifies the caller's DataFrame"""
+        original = self.sample_data.copy()
+        calculator = ChinaZIndex(self.sample_data, copy=False)
+        calculator.calculate('seasonal')
+        
+        pd.testing.assert_frame_equal(self.sample_data, original)
+        self.assertTrue(np.shares_memory(calculator._precip, self.sample_data['precipitation'].to_numpy()))
+        self.assertFalse(np.shares_memory(self.calculator._precip, self.sample_data['precipitation'].to_numpy()))
+        pd.testing.assert_frame_equal(
+            calculator.calculate_monthly_czi(),
+            self.calculator.calculate_monthly_czi()
+        )
+    
+    def test_reuse_preprocessed_data(self):
+        """Test that already date-indexed data is not preprocessed again"""
+        reused = ChinaZIndex(self.calculator.data, copy=False)
+        
+        self.assertIs(reused.data, self.calculator.data)
+        pd.testing.assert_frame_equal(reused.calculate_monthly_czi(), self.calculator.calculate_monthly_czi())
+    
+    def test_mismatched_datetime_index(self):
+        """Test that a DatetimeIndex disagreeing with year/month is replaced"""
+        shifted = self.calculator.data.copy()
+        shifted.index = shifted.index + pd.DateOffset(years=1)
+        calculator = ChinaZIndex(shifted, copy=False)
+        
+        self.assertTrue(calculator.data.index.equals(self.calculator.data.index))
+        pd.testing.assert_frame_equal(calculator.calculate_annual_czi(), self.calculator.calculate_annual_czi())
     
     def test_monthly_calculation(self):
         """Test monthly CZI calculation"""
-        calculator = ChinaZIndex(self.sample_data)
-        results = calculator.calculate_monthly_czi()
+        results = self.calculator.calculate_monthly_czi()
         
         self.assertIn('CZI', results.columns)
         self.assertIn('Drought_Class', results.columns)
@@ -30,19 +69,84 @@ class TestChinaZIndex(unittest.TestCase):
     
     def test_seasonal_calculation(self):
         """Test seasonal CZI calculation"""
-        calculator = ChinaZIndex(self.sample_data)
-        results = calculator.calculate_seasonal_czi()
+        results = self.calculator.calculate_seasonal_czi()
         
         self.assertIn('CZI', results.columns)
         self.assertIn('Drought_Class', results.columns)
     
     def test_annual_calculation(self):
         """Test annual CZI calculation"""
-        calculator = ChinaZIndex(self.sample_data)
-        results = calculator.calculate_annual_czi()
+        results = self.calculator.calculate_annual_czi()
         
         self.assertIn('CZI', results.columns)
         self.assertIn('Drought_Class', results.columns)
+        
+        # The compact grouping key must not leak into the output
+        self.assertEqual(results['year'].dtype, np.int64)
+    
+    def test_vectorized_classification(self):
+        """Test array and scalar classification at the class boundaries"""
+        values = np.array([2.5, 2.0, 1.5, 1.0, 0.5, 0.49, -0.49, -0.5, -0.99, -1.0,
+                           -1.49, -1.5, -1.99, -2.0, np.nan])
+        expected = ['Extremely Wet', 'Extremely Wet', 'Severe Wet', 'Moderate Wet', 'Mild Wet',
+                    'Normal', 'Normal', 'Mild Drought', 'Mild Drought', 'Moderate Drought',
+                    'Moderate Drought', 'Severe Drought', 'Severe Drought', 'Extreme Drought',
+                    'No Data']
+        self.assertEqual(list(ChinaZIndex.classify_drought(values)), expected)
+        self.assertEqual([ChinaZIndex.classify_drought(v) for v in values], expected)
+    
+    def test_drought_class_categorical(self):
+        """Test that Drought_Class is stored as an ordered categorical"""
+        drought_class = self.calculator.calculate_monthly_czi()['Drought_Class']
+        self.assertIsInstance(drought_class.dtype, pd.CategoricalDtype)
+        self.assertTrue(drought_class.cat.ordered)
+        self.assertEqual(list(drought_class.cat.categories[:2]), ['Extreme Drought', 'Severe Drought'])
+    
+    def test_negative_cube_root_base(self):
+        """Test that dry months with a negative Wilson-Hilferty base stay real"""
+        test_data = pd.DataFrame({
+            'year': [2000] * 12,
+            'month': range(1, 13),
+            'precipitation': [7, 9, 10, 6, 0, 30, 9, 5, 5, 7, 2, 4]  # Dry May, wet June
+        })
+        
+        calculator = ChinaZIndex(test_data)
+        czi = calculator.calculate_czi(calculator.data['precipitation'])
+        
+        self.assertFalse(czi.isna().any())
+        self.assertEqual(czi.idxmin().month, 5)
+    
+    def test_single_pass_moments(self):
+        """Test single-pass moments against two-pass NumPy statistics"""
+        x = np.array([7, 9, 10, 6, 0, 30, 9, 5, 5, 7, 2, np.nan])
+        p = x[~np.isnan(x)]
+        n, mean, std, m3 = _moments(x, center=np.median(p))
+        
+        self.assertEqual(n, 11)
+        self.assertAlmostEqual(mean, np.mean(p))
+        self.assertAlmostEqual(std, np.std(p, ddof=1))
+        self.assertAlmostEqual(m3, np.mean((p - np.median(p)) ** 3))
+        self.assertEqual(_moments(np.full(12, 0.1))[2], 0)
+    
+    def test_power_sums_match_numpy(self):
+        """Test that the compiled power sums match the NumPy reference"""
+        x = np.array([np.nan, 2.5, 0.0, 7.0, 30.0])
+        for shift in (np.nan, 2.0):
+            np.testing.assert_allclose(_power_sums(x, shift), _power_sums_numpy(x, shift))
+    
+    def test_moments_with_large_offset(self):
+        """Test that a large mean does not cancel the skewness"""
+        x = _sample(len(self.sample_data)) + 1e5
+        _, mean, std, m3 = _moments(x)
+        
+        self.assertAlmostEqual(mean, np.mean(x))
+        self.assertAlmostEqual(std, np.std(x, ddof=1))
+        self.assertAlmostEqual(m3 / std ** 3, np.mean((x - np.mean(x)) ** 3) / std ** 3, places=6)
+        np.testing.assert_allclose(
+            self.calculator.calculate_czi(pd.Series(x)),
+            self.calculator.calculate_czi(pd.Series(x - 1e5)),
+            atol=1e-6
+        )
 
 if __name__ == '__main__':
     unittest.main()
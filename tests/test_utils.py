@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+import numpy as np
+from dic.utils import export_to_excel
+
+class TestExportToExcel(unittest.TestCase):
+    
+    def test_round_trip(self):
+        """Test that NaN, inf, categorical and datetime values survive export"""
+        df = pd.DataFrame({
+            'value': [1.5, np.inf, -np.inf, np.nan],
+            'Drought_Class': pd.Categorical(['Normal', 'Mild Wet', None, 'Normal']),
+            'date': pd.to_datetime(['2000-01-01', None, '2001-02-01', '2002-03-01']),
+            'year': [2000, 2000, 2001, 2002]
+        })
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'results.xlsx')
+            # Small blocks so the sheet is written across a block boundary
+            with mock.patch('dic.utils._EXCEL_BLOCK_ROWS', 3):
+                export_to_excel({'Monthly': df, 'Empty': df.iloc[:0]}, filename)
+            sheets = pd.read_excel(filename, sheet_name=None)
+        
+        self.assertEqual(list(sheets), ['Monthly', 'Empty'])
+        pd.testing.assert_frame_equal(sheets['Monthly'], df.astype({'Drought_Class': object}))
+        self.assertEqual(list(sheets['Empty'].columns), list(df.columns))
+
+if __name__ == '__main__':
+    unittest.main()